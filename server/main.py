@@ -9,16 +9,30 @@ Version: 2.0.0
 """
 
 from fastmcp import FastMCP
-import requests
-from typing import Dict, Any
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+import json
 import logging
 import math
 import sys
+import time
+
+import numpy as np
+
+# Prefer orjson for decoding large GeoJSON responses when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; keep tool output readable
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # Initialize MCP server
 mcp = FastMCP("AGS Boreholes API")
@@ -26,6 +40,26 @@ mcp = FastMCP("AGS Boreholes API")
 # API Configuration
 OGC_API_BASE_URL = "https://ogcapi.bgs.ac.uk"
 COLLECTION_NAME = "agsboreholeindex"
+_COLLECTION_URL = f"{OGC_API_BASE_URL}/collections/{COLLECTION_NAME}"
+_ITEMS_URL = f"{_COLLECTION_URL}/items"
+
+# Shared HTTP/2 client so repeated tool calls and concurrent tile requests
+# reuse (and multiplex over) keep-alive connections
+_CLIENT = httpx.Client(
+    headers={"Accept": "application/json", "User-Agent": "ags-mcp/2.0"},
+    timeout=30,
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+    )
+)
+
+# Gateway errors from the BGS service are usually transient, so retry them
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_MAX_RETRIES = 2
+_RETRY_BACKOFF_S = 0.2
 
 # UK geographic bounds for validation
 UK_BOUNDS = {
@@ -34,12 +68,161 @@ UK_BOUNDS = {
     "min_lon": -8.0,
     "max_lon": 2.0
 }
+_MIN_LAT, _MAX_LAT, _MIN_LON, _MAX_LON = (
+    UK_BOUNDS["min_lat"], UK_BOUNDS["max_lat"], UK_BOUNDS["min_lon"], UK_BOUNDS["max_lon"]
+)
+
+# Approximate length of one degree of latitude, used for buffers and distances
+_KM_PER_DEG = 111.0
+_DEG_PER_KM = 1.0 / _KM_PER_DEG
+
+# Area searches larger than this are split into tiles fetched concurrently.
+# MAX_AREA_FEATURES is shared evenly between the tiles; tiles that hit their
+# share are quartered again (up to MAX_TILE_SPLITS times) only while the
+# remaining budget allows it, otherwise the result is reported as truncated
+TILE_SIZE_DEG = 0.5
+MAX_TILES_PER_SIDE = 8
+MAX_TILE_WORKERS = 8
+MAX_TILE_SPLITS = 2
+MAX_AREA_FEATURES = 5000
+
+# Airy 1830 ellipsoid and National Grid projection constants (OSGB36)
+_AIRY_A = 6377563.396
+_AIRY_B = 6356256.909
+_AIRY_E2 = 1.0 - (_AIRY_B * _AIRY_B) / (_AIRY_A * _AIRY_A)
+_N = (_AIRY_A - _AIRY_B) / (_AIRY_A + _AIRY_B)
+_N2 = _N * _N
+_N3 = _N2 * _N
+_N4 = _N3 * _N
+_F0 = 0.9996012717
+_PHI0 = math.radians(49.0)
+_LAMBDA0 = math.radians(-2.0)
+_E0 = 400000.0
+_N0 = -100000.0
+
+# Rectifying radius and meridional arc at the true origin, used to obtain the
+# footpoint latitude in closed form instead of iterating on the arc length
+_RECT_A = _AIRY_A / (1.0 + _N) * (1.0 + _N2 / 4.0 + _N4 / 64.0)
+_M0 = _RECT_A * (
+    _PHI0
+    - (1.5 * _N - 0.5625 * _N3) * math.sin(2.0 * _PHI0)
+    + (0.9375 * _N2 - 0.46875 * _N4) * math.sin(4.0 * _PHI0)
+    - (35.0 / 48.0 * _N3) * math.sin(6.0 * _PHI0)
+    + (315.0 / 512.0 * _N4) * math.sin(8.0 * _PHI0)
+)
+_FP1 = 1.5 * _N - 27.0 / 32.0 * _N3
+_FP2 = 21.0 / 16.0 * _N2 - 55.0 / 32.0 * _N4
+_FP3 = 151.0 / 96.0 * _N3
+_FP4 = 1097.0 / 512.0 * _N4
+_AF0 = _AIRY_A * _F0
+
+# GRS80 ellipsoid (WGS84 to well under a metre)
+_GRS80_A = 6378137.0
+_GRS80_B = 6356752.314140
+_GRS80_E2 = 1.0 - (_GRS80_B * _GRS80_B) / (_GRS80_A * _GRS80_A)
+_GRS80_EP2 = (_GRS80_A * _GRS80_A) / (_GRS80_B * _GRS80_B) - 1.0
+
+# OSGB36 -> WGS84 Helmert transformation (translations in metres, scale in ppm,
+# rotations in arc seconds converted to radians)
+_TX, _TY, _TZ = 446.448, -125.157, 542.060
+_S1 = 1.0 + (-20.4894e-6)
+_RX = math.radians(0.1502 / 3600.0)
+_RY = math.radians(0.2470 / 3600.0)
+_RZ = math.radians(0.8421 / 3600.0)
+
+def _bng_to_osgb36(easting, northing):
+    """Convert BNG easting/northing to OSGB36 latitude/longitude in radians.
+    
+    Ordnance Survey inverse Transverse Mercator series on the Airy 1830
+    ellipsoid. Only NumPy ufuncs are used, so inputs may be scalars or arrays.
+    """
+    # Footpoint latitude from the rectifying latitude series (no iteration)
+    mu = ((northing - _N0) / _F0 + _M0) / _RECT_A
+    phi_f = (mu
+             + _FP1 * np.sin(2.0 * mu)
+             + _FP2 * np.sin(4.0 * mu)
+             + _FP3 * np.sin(6.0 * mu)
+             + _FP4 * np.sin(8.0 * mu))
+    
+    sin_f = np.sin(phi_f)
+    cos_f = np.cos(phi_f)
+    tan_f = sin_f / cos_f
+    sec_f = 1.0 / cos_f
+    t2 = tan_f * tan_f
+    t4 = t2 * t2
+    
+    w = 1.0 - _AIRY_E2 * sin_f * sin_f
+    nu = _AF0 / np.sqrt(w)
+    rho = _AF0 * (1.0 - _AIRY_E2) / (w * np.sqrt(w))
+    eta2 = nu / rho - 1.0
+    nu3 = nu * nu * nu
+    nu5 = nu3 * nu * nu
+    
+    vii = tan_f / (2.0 * rho * nu)
+    viii = tan_f / (24.0 * rho * nu3) * (5.0 + 3.0 * t2 + eta2 - 9.0 * t2 * eta2)
+    ix = tan_f / (720.0 * rho * nu5) * (61.0 + 90.0 * t2 + 45.0 * t4)
+    x = sec_f / nu
+    xi = sec_f / (6.0 * nu3) * (nu / rho + 2.0 * t2)
+    xii = sec_f / (120.0 * nu5) * (5.0 + 28.0 * t2 + 24.0 * t4)
+    xiia = sec_f / (5040.0 * nu5 * nu * nu) * (61.0 + 662.0 * t2 + 1320.0 * t4 + 720.0 * t4 * t2)
+    
+    de = easting - _E0
+    de2 = de * de
+    de3 = de2 * de
+    de4 = de2 * de2
+    phi = phi_f - vii * de2 + viii * de4 - ix * de4 * de2
+    lam = _LAMBDA0 + x * de - xi * de3 + xii * de3 * de2 - xiia * de4 * de3
+    
+    return phi, lam
+
+def _osgb36_to_wgs84(phi, lam):
+    """Shift OSGB36 latitude/longitude (radians) to WGS84 (degrees).
+    
+    7-parameter Helmert transformation between the cartesian frames.
+    """
+    # OSGB36 geodetic -> cartesian (height taken as zero)
+    sin_phi = np.sin(phi)
+    cos_phi = np.cos(phi)
+    nu_a = _AIRY_A / np.sqrt(1.0 - _AIRY_E2 * sin_phi * sin_phi)
+    x1 = nu_a * cos_phi * np.cos(lam)
+    y1 = nu_a * cos_phi * np.sin(lam)
+    z1 = nu_a * (1.0 - _AIRY_E2) * sin_phi
+    
+    # Helmert shift to WGS84
+    x2 = _TX + _S1 * x1 - _RZ * y1 + _RY * z1
+    y2 = _TY + _RZ * x1 + _S1 * y1 - _RX * z1
+    z2 = _TZ - _RY * x1 + _RX * y1 + _S1 * z1
+    
+    # Cartesian -> WGS84 geodetic using Bowring's closed-form latitude
+    p = np.sqrt(x2 * x2 + y2 * y2)
+    theta = np.arctan2(z2 * _GRS80_A, p * _GRS80_B)
+    sin_t = np.sin(theta)
+    cos_t = np.cos(theta)
+    lat = np.arctan2(z2 + _GRS80_EP2 * _GRS80_B * sin_t * sin_t * sin_t,
+                     p - _GRS80_E2 * _GRS80_A * cos_t * cos_t * cos_t)
+    lon = np.arctan2(y2, x2)
+    
+    return np.degrees(lat), np.degrees(lon)
+
+def _bng_to_wgs84(easting, northing):
+    """Convert BNG easting/northing to WGS84 latitude/longitude.
+    
+    Args:
+        easting: BNG easting coordinate(s) (meters)
+        northing: BNG northing coordinate(s) (meters)
+        
+    Returns:
+        Tuple of (latitude, longitude) in decimal degrees, matching the
+        shape of the inputs
+    """
+    phi, lam = _bng_to_osgb36(easting, northing)
+    return _osgb36_to_wgs84(phi, lam)
 
 def convert_bng_to_wgs84(easting: float, northing: float) -> tuple[float, float]:
     """Convert British National Grid coordinates to WGS84 lat/lon.
     
-    Uses simplified approximation suitable for most geological applications.
-    For precise surveying, use pyproj or similar projection library.
+    Accurate to a few metres, which is well within the precision of the
+    borehole index. For survey-grade work use OSTN15 via pyproj.
     
     Args:
         easting: BNG easting coordinate (meters)
@@ -48,12 +231,18 @@ def convert_bng_to_wgs84(easting: float, northing: float) -> tuple[float, float]
     Returns:
         Tuple of (latitude, longitude) in decimal degrees
     """
-    # Simplified conversion using linear approximation
-    # Based on OSGB36 parameters with sufficient accuracy for geological work
-    lat_approx = 49.0 + (northing - 100000) / 111000
-    lon_approx = -2.0 + (easting - 400000) / (111000 * math.cos(math.radians(lat_approx)))
+    lat, lon = _bng_to_wgs84(float(easting), float(northing))
+    return float(lat), float(lon)
+
+def _enhance_arrays(xs, ys, search_lat, search_lon, cos_lat):
+    """Convert coordinate arrays and compute distances from the search point.
     
-    return lat_approx, lon_approx
+    Inputs are float64 arrays of valid (non-NaN) eastings/northings; the distance array is
+    meaningful only when a search point is given. Returns (lats, lons, dists).
+    """
+    lats, lons = _bng_to_wgs84(xs, ys)
+    dists = np.hypot(lats - search_lat, (lons - search_lon) * cos_lat) * _KM_PER_DEG
+    return lats, lons, dists
 
 def validate_uk_coordinates(lat: float, lon: float) -> bool:
     """Validate coordinates are within UK territory bounds.
@@ -65,39 +254,72 @@ def validate_uk_coordinates(lat: float, lon: float) -> bool:
     Returns:
         True if coordinates are within UK bounds
     """
-    return (UK_BOUNDS["min_lat"] <= lat <= UK_BOUNDS["max_lat"] and 
-            UK_BOUNDS["min_lon"] <= lon <= UK_BOUNDS["max_lon"])
+    return _MIN_LAT <= lat <= _MAX_LAT and _MIN_LON <= lon <= _MAX_LON
 
-def calculate_bbox(lat: float, lon: float, buffer_km: float) -> str:
+def calculate_bbox(lat: float, lon: float, buffer_km: float,
+                   cos_lat: float = None) -> tuple[float, float, float, float]:
     """Calculate bounding box around a point.
     
     Args:
         lat: Center latitude
         lon: Center longitude  
         buffer_km: Buffer radius in kilometers
+        cos_lat: Optional precomputed cosine of the center latitude
         
     Returns:
-        Comma-separated bbox string (min_lon,min_lat,max_lon,max_lat)
+        Bbox tuple (min_lon, min_lat, max_lon, max_lat)
     """
-    lat_buffer = buffer_km / 111.0
-    lon_buffer = buffer_km / (111.0 * math.cos(math.radians(lat)))
+    if cos_lat is None:
+        cos_lat = math.cos(math.radians(lat))
+    
+    lat_buffer = buffer_km * _DEG_PER_KM
+    lon_buffer = lat_buffer / cos_lat
     
     min_lon = lon - lon_buffer
     min_lat = lat - lat_buffer
     max_lon = lon + lon_buffer
     max_lat = lat + lat_buffer
     
-    return f"{min_lon},{min_lat},{max_lon},{max_lat}"
+    return (min_lon, min_lat, max_lon, max_lat)
 
-def enhance_feature_properties(feature: Dict[str, Any], search_lat: float = None, search_lon: float = None) -> None:
+def _cache_depth(props: Dict[str, Any]) -> None:
+    """Store the parsed final depth (loca_fdep) on props as '_depth_m'.
+    
+    Downstream tools read the cached float instead of re-parsing the raw value.
+    """
+    raw = props.get('loca_fdep')
+    if raw is not None:
+        try:
+            props['_depth_m'] = float(raw)
+        except (TypeError, ValueError):
+            pass
+
+def _feature_depth(props: Dict[str, Any]) -> Optional[float]:
+    """Return the final depth of a feature in meters, or None if unknown.
+    
+    Uses the value cached by enhancement when present, so results passed back
+    in from other clients without '_depth_m' are still handled.
+    """
+    if '_depth_m' not in props:
+        _cache_depth(props)
+    return props.get('_depth_m')
+
+def enhance_feature_properties(feature: Dict[str, Any], search_lat: float = None, search_lon: float = None,
+                               cos_lat: float = None) -> None:
     """Enhance feature properties with calculated coordinates and distance.
     
+    Distances use the equirectangular (cheap-ruler) approximation, scaling the
+    longitude difference by the cosine of the search latitude.
+    
     Args:
         feature: GeoJSON feature to enhance
         search_lat: Optional search center latitude for distance calculation
         search_lon: Optional search center longitude for distance calculation
+        cos_lat: Optional precomputed cosine of search_lat, to avoid repeating
+            the trig call for every feature of a response
     """
-    props = feature.get('properties', {})
+    props = feature.get('properties') or {}
+    _feature_depth(props)
     
     # Convert BNG coordinates to WGS84 if available
     if props.get('x') and props.get('y'):
@@ -108,41 +330,101 @@ def enhance_feature_properties(feature: Dict[str, Any], search_lat: float = None
             
             # Calculate distance from search point if provided
             if search_lat is not None and search_lon is not None:
+                if cos_lat is None:
+                    cos_lat = math.cos(math.radians(search_lat))
                 distance = math.sqrt(
-                    (lat_calc - search_lat) ** 2 + (lon_calc - search_lon) ** 2
-                ) * 111  # Convert to km
+                    (lat_calc - search_lat) ** 2 + ((lon_calc - search_lon) * cos_lat) ** 2
+                ) * _KM_PER_DEG  # Convert to km
                 props['distance_km'] = round(distance, 2)
         except Exception as e:
-            logger.warning(f"Coordinate conversion failed for feature {props.get('loca_id', 'unknown')}: {e}")
+            logger.warning("Coordinate conversion failed for feature %s: %s", props.get('loca_id', 'unknown'), e)
 
-def make_api_request(bbox: str, limit: int = 100) -> Dict[str, Any]:
+def enhance_features(features: list, search_lat: float = None, search_lon: float = None,
+                     cos_lat: float = None) -> None:
+    """Enhance a list of features in a single vectorized pass.
+    
+    Equivalent to calling enhance_feature_properties on each feature, but the
+    coordinate conversion and distance calculation run once over NumPy arrays.
+    
+    Args:
+        features: GeoJSON features to enhance in place
+        search_lat: Optional search center latitude for distance calculation
+        search_lon: Optional search center longitude for distance calculation
+        cos_lat: Optional precomputed cosine of search_lat
+    """
+    if not features:
+        return
+    
+    props_list = [feature.get('properties') or {} for feature in features]
+    count = len(props_list)
+    nan = math.nan
+    try:
+        xs = np.fromiter((props.get('x') or nan for props in props_list), dtype=np.float64, count=count)
+        ys = np.fromiter((props.get('y') or nan for props in props_list), dtype=np.float64, count=count)
+    except (TypeError, ValueError):
+        # Non-numeric coordinates somewhere in the batch; fall back per feature
+        for feature in features:
+            enhance_feature_properties(feature, search_lat, search_lon, cos_lat)
+        return
+    
+    for props in props_list:
+        _feature_depth(props)
+    
+    valid = ~(np.isnan(xs) | np.isnan(ys))
+    
+    with_distance = search_lat is not None and search_lon is not None
+    if with_distance:
+        if cos_lat is None:
+            cos_lat = math.cos(math.radians(search_lat))
+    else:
+        search_lat = search_lon = cos_lat = 0.0
+    
+    # Only features with both coordinates are converted
+    indices = np.flatnonzero(valid)
+    lats, lons, dists = _enhance_arrays(xs[indices], ys[indices],
+                                        float(search_lat), float(search_lon), float(cos_lat))
+    
+    _round = round
+    for i, lat_calc, lon_calc, distance in zip(indices.tolist(), lats.tolist(), lons.tolist(), dists.tolist()):
+        props = props_list[i]
+        props['calculated_latitude'] = _round(lat_calc, 6)
+        props['calculated_longitude'] = _round(lon_calc, 6)
+        if with_distance:
+            props['distance_km'] = _round(distance, 2)
+
+def _get(url: str, **kwargs) -> httpx.Response:
+    """GET a URL through the shared client, retrying transient gateway errors.
+    
+    Connection failures are retried by the transport; this adds exponential
+    backoff retries for the HTTP statuses in _RETRY_STATUSES.
+    """
+    for attempt in range(_MAX_RETRIES + 1):
+        response = _CLIENT.get(url, **kwargs)
+        if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+            return response
+        time.sleep(_RETRY_BACKOFF_S * (2 ** attempt))
+
+def make_api_request(bbox: tuple[float, float, float, float], limit: int = 100) -> Dict[str, Any]:
     """Make request to BGS OGC API.
     
     Args:
-        bbox: Bounding box string
+        bbox: Bounding box tuple (min_lon, min_lat, max_lon, max_lat)
         limit: Maximum number of results
         
     Returns:
         API response dictionary or error dictionary
     """
-    url = f"{OGC_API_BASE_URL}/collections/{COLLECTION_NAME}/items"
-    params = {
-        'bbox': bbox,
-        'limit': limit,
-        'f': 'json'
-    }
-    
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = _get(_ITEMS_URL, params={'bbox': ','.join(map(str, bbox)), 'limit': limit, 'f': 'json'})
         
         if response.status_code != 200:
             return {
                 "error": f"API returned HTTP {response.status_code}",
-                "message": response.text[:200],
-                "request_url": response.url
+                "message": response.content[:200].decode('utf-8', 'replace'),
+                "request_url": str(response.url)
             }
         
-        return response.json()
+        return _json_loads(response.content)
         
     except Exception as e:
         return {
@@ -150,6 +432,134 @@ def make_api_request(bbox: str, limit: int = 100) -> Dict[str, Any]:
             "message": str(e)
         }
 
+def tile_bbox(min_lat: float, min_lon: float, max_lat: float,
+              max_lon: float) -> list[tuple[float, float, float, float]]:
+    """Split a bounding box into a grid of tile bounding boxes.
+    
+    Tiles are at most TILE_SIZE_DEG on a side, up to MAX_TILES_PER_SIDE tiles
+    in each direction (beyond that the tiles grow to cover the area).
+    
+    Args:
+        min_lat: Southern boundary in decimal degrees
+        min_lon: Western boundary in decimal degrees
+        max_lat: Northern boundary in decimal degrees
+        max_lon: Eastern boundary in decimal degrees
+        
+    Returns:
+        List of bbox tuples (min_lon, min_lat, max_lon, max_lat)
+    """
+    nx = min(max(1, math.ceil((max_lon - min_lon) / TILE_SIZE_DEG)), MAX_TILES_PER_SIDE)
+    ny = min(max(1, math.ceil((max_lat - min_lat) / TILE_SIZE_DEG)), MAX_TILES_PER_SIDE)
+    dx = (max_lon - min_lon) / nx
+    dy = (max_lat - min_lat) / ny
+    
+    bboxes = []
+    for j in range(ny):
+        tile_min_lat = min_lat + j * dy
+        tile_max_lat = max_lat if j == ny - 1 else tile_min_lat + dy
+        for i in range(nx):
+            tile_min_lon = min_lon + i * dx
+            tile_max_lon = max_lon if i == nx - 1 else tile_min_lon + dx
+            bboxes.append((tile_min_lon, tile_min_lat, tile_max_lon, tile_max_lat))
+    
+    return bboxes
+
+def _merge_features(results: list) -> list:
+    """Concatenate features from several API responses, dropping duplicates.
+    
+    Boreholes on a shared tile edge are returned by both tiles; they are
+    identified by loca_id, keeping the first occurrence in tile order.
+    Features without a loca_id cannot be matched and are always kept.
+    """
+    merged = {}
+    for data in results:
+        for feature in data.get('features', []):
+            loca_id = (feature.get('properties') or {}).get('loca_id')
+            key = ('id', loca_id) if loca_id is not None else ('anon', len(merged))
+            if key not in merged:
+                merged[key] = feature
+    return list(merged.values())
+
+def _is_truncated(data: Dict[str, Any], limit: int) -> bool:
+    """Return True if an API response was cut off at the result limit."""
+    if any(isinstance(link, dict) and link.get('rel') == 'next' for link in data.get('links', [])):
+        return True
+    returned = data.get('numberReturned', len(data.get('features', [])))
+    return returned >= limit
+
+def _split_bbox(bbox: tuple[float, float, float, float]) -> list[tuple[float, float, float, float]]:
+    """Split a bbox tuple into its four quadrants."""
+    min_lon, min_lat, max_lon, max_lat = bbox
+    mid_lon = (min_lon + max_lon) / 2
+    mid_lat = (min_lat + max_lat) / 2
+    return [
+        (min_lon, min_lat, mid_lon, mid_lat),
+        (mid_lon, min_lat, max_lon, mid_lat),
+        (min_lon, mid_lat, mid_lon, max_lat),
+        (mid_lon, mid_lat, max_lon, max_lat)
+    ]
+
+def _fetch_tiles(bboxes: list[tuple[float, float, float, float]], limit: int = 1000) -> Dict[str, Any]:
+    """Fetch several bounding boxes concurrently over the shared client.
+    
+    The MAX_AREA_FEATURES budget is shared evenly between the tiles, so each
+    tile is requested with at most MAX_AREA_FEATURES // len(bboxes) results.
+    Truncated tiles are quartered and refetched at the full limit, up to
+    MAX_TILE_SPLITS levels, but only when every truncated tile can be split
+    within the remaining budget; otherwise their results are kept as they are
+    so any cut-off is spread evenly over the area.
+    
+    Args:
+        bboxes: Bounding box tuples to request
+        limit: Maximum number of results per tile
+        
+    Returns:
+        Dictionary with the merged features, pagination links (only when a
+        single tile was fetched), number of tiles and a truncated flag, or the
+        first error dictionary returned by any tile
+    """
+    results = []
+    truncated = False
+    budget = MAX_AREA_FEATURES
+    tile_limit = max(1, min(limit, MAX_AREA_FEATURES // len(bboxes)))
+    pending = [(bbox, 0) for bbox in bboxes]
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_TILE_WORKERS, len(bboxes))) as executor:
+        while pending:
+            batch = list(executor.map(lambda tile: make_api_request(tile[0], limit=tile_limit), pending))
+            
+            full = []
+            for (bbox, depth), data in zip(pending, batch):
+                if 'error' in data:
+                    return data
+                if _is_truncated(data, tile_limit):
+                    full.append((bbox, depth, data))
+                else:
+                    results.append(data)
+                    budget -= len(data.get('features', []))
+            
+            # Split all truncated tiles or none of them; the quadrants cover
+            # each tile, so its partial result is dropped when it is split
+            can_split = (
+                full and
+                all(depth < MAX_TILE_SPLITS for _, depth, _ in full) and
+                4 * limit * len(full) <= budget
+            )
+            if can_split:
+                pending = [(sub_bbox, depth + 1) for bbox, depth, _ in full for sub_bbox in _split_bbox(bbox)]
+                tile_limit = limit
+            else:
+                results.extend(data for _, _, data in full)
+                truncated = truncated or bool(full)
+                pending = []
+    
+    return {
+        "features": _merge_features(results),
+        "links": results[0].get('links', []) if len(results) == 1 else [],
+        "tiles": len(results),
+        "truncated": truncated
+    }
+
 @mcp.tool
 def check_bgs_service_status() -> Dict[str, Any]:
     """Check if BGS OGC API service is available and responding.
@@ -158,21 +568,21 @@ def check_bgs_service_status() -> Dict[str, Any]:
         Dictionary with service status, metadata, and collection information
     """
     try:
-        response = requests.get(f"{OGC_API_BASE_URL}/collections/{COLLECTION_NAME}", timeout=10)
+        response = _get(_COLLECTION_URL, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
             return {
                 "status": "healthy",
                 "title": data.get("title", "Unknown"),
                 "description": data.get("description", "No description")[:200],
-                "api_url": f"{OGC_API_BASE_URL}/collections/{COLLECTION_NAME}"
+                "api_url": _COLLECTION_URL
             }
         else:
             return {
                 "status": "error",
                 "error": f"HTTP {response.status_code}",
-                "message": response.text[:200]
+                "message": response.content[:200].decode('utf-8', 'replace')
             }
     except Exception as e:
         return {
@@ -181,21 +591,23 @@ def check_bgs_service_status() -> Dict[str, Any]:
             "message": str(e)
         }
 
-@mcp.tool
-def get_boreholes_at_location(latitude: float, longitude: float, buffer_km: float = 1.0) -> Dict[str, Any]:
-    """Get borehole data at a specific location with buffer radius.
+def _fetch_and_enhance(latitude: float, longitude: float, buffer_km: float, limit: int = 100,
+                       min_depth_m: float = None) -> Dict[str, Any]:
+    """Fetch boreholes around a point and enhance them in a single pass.
+    
+    When min_depth_m is given, features are filtered on depth before any
+    coordinate conversion so shallow boreholes are never enhanced.
     
     Args:
         latitude: Latitude in decimal degrees (WGS84)
-        longitude: Longitude in decimal degrees (WGS84) 
-        buffer_km: Search radius in kilometers (default: 1.0)
+        longitude: Longitude in decimal degrees (WGS84)
+        buffer_km: Search radius in kilometers
+        limit: Maximum number of results requested from the API
+        min_depth_m: Optional minimum final depth in meters
     
     Returns:
-        Dictionary containing:
-        - features: List of borehole GeoJSON features
-        - count: Number of boreholes found
-        - search_params: Search parameters used
-        - links: API pagination links
+        Dictionary with the kept features, total_searched, search_params and
+        links, or an error dictionary
     """
     # Validate coordinates
     if not validate_uk_coordinates(latitude, longitude):
@@ -206,26 +618,38 @@ def get_boreholes_at_location(latitude: float, longitude: float, buffer_km: floa
         }
     
     # Calculate bounding box and make API request
-    bbox = calculate_bbox(latitude, longitude, buffer_km)
-    data = make_api_request(bbox, limit=100)
+    cos_lat = math.cos(math.radians(latitude))
+    bbox = calculate_bbox(latitude, longitude, buffer_km, cos_lat)
+    data = make_api_request(bbox, limit=limit)
     
     if 'error' in data:
         data['search_params'] = {"latitude": latitude, "longitude": longitude, "buffer_km": buffer_km}
         return data
     
-    # Enhance features with calculated coordinates and distances
     features = data.get('features', [])
+    total_searched = len(features)
+    
+    # Drop shallow boreholes before doing any coordinate work
+    if min_depth_m is not None:
+        kept = []
+        append = kept.append
+        for feature in features:
+            depth = _feature_depth(feature.get('properties') or {})
+            if depth is not None and depth >= min_depth_m:
+                append(feature)
+        features = kept
+    
+    # Enhance features with calculated coordinates and distances
+    enhance_features(features, latitude, longitude, cos_lat)
     for feature in features:
-        enhance_feature_properties(feature, latitude, longitude)
-        
         # Add search context to each feature
-        props = feature.get('properties', {})
+        props = feature.get('properties') or {}
         props['search_location'] = {'lat': latitude, 'lon': longitude}
         props['search_buffer_km'] = buffer_km
     
     return {
         "features": features,
-        "count": len(features),
+        "total_searched": total_searched,
         "search_params": {
             "latitude": latitude,
             "longitude": longitude, 
@@ -235,11 +659,42 @@ def get_boreholes_at_location(latitude: float, longitude: float, buffer_km: floa
         "links": data.get('links', [])
     }
 
+@mcp.tool
+def get_boreholes_at_location(latitude: float, longitude: float, buffer_km: float = 1.0) -> Dict[str, Any]:
+    """Get borehole data at a specific location with buffer radius.
+    
+    Args:
+        latitude: Latitude in decimal degrees (WGS84)
+        longitude: Longitude in decimal degrees (WGS84) 
+        buffer_km: Search radius in kilometers (default: 1.0)
+    
+    Returns:
+        Dictionary containing:
+        - features: List of borehole GeoJSON features
+        - count: Number of boreholes found
+        - search_params: Search parameters used
+        - links: API pagination links
+    """
+    result = _fetch_and_enhance(latitude, longitude, buffer_km)
+    
+    if 'error' in result:
+        return result
+    
+    return {
+        "features": result["features"],
+        "count": len(result["features"]),
+        "search_params": result["search_params"],
+        "links": result["links"]
+    }
+
 @mcp.tool  
 def search_boreholes_in_area(min_latitude: float, min_longitude: float, 
                            max_latitude: float, max_longitude: float) -> Dict[str, Any]:
     """Search for boreholes within a bounding box area.
     
+    Areas extending beyond the UK are clamped to UK bounds; only areas with
+    no overlap at all are rejected.
+    
     Args:
         min_latitude: Southern boundary in decimal degrees
         min_longitude: Western boundary in decimal degrees  
@@ -250,28 +705,54 @@ def search_boreholes_in_area(min_latitude: float, min_longitude: float,
         Dictionary containing:
         - features: List of borehole GeoJSON features  
         - count: Number of boreholes found
-        - search_area: Search boundary parameters
-        - links: API pagination links
+        - search_area: Search boundary parameters, including the number of
+          tiles the area was split into
+        - links: API pagination links (empty when the area was tiled)
+        - truncated: True if some results were cut off by the per-tile or
+          total result limits
+        - clamped: Present and True when the area was clamped to UK bounds
     """
-    # Validate all coordinates are within UK
-    coords_valid = (
+    provided_bounds = {
+        "min_lat": min_latitude, "min_lon": min_longitude,
+        "max_lat": max_latitude, "max_lon": max_longitude
+    }
+    
+    # Reject NaN/infinite and inverted bounds before any clamping
+    if not all(math.isfinite(bound) for bound in (min_latitude, min_longitude, max_latitude, max_longitude)):
+        return {
+            "error": "Invalid coordinates",
+            "message": "All bounds must be finite numbers",
+            "provided_bounds": provided_bounds
+        }
+    
+    if not (min_latitude <= max_latitude and min_longitude <= max_longitude):
+        return {
+            "error": "Invalid bounding box",
+            "message": "min_latitude/min_longitude must not exceed max_latitude/max_longitude",
+            "provided_bounds": provided_bounds
+        }
+    
+    # Clamp the area to UK bounds, rejecting it only if nothing is left
+    clamped = not (
         validate_uk_coordinates(min_latitude, min_longitude) and
         validate_uk_coordinates(max_latitude, max_longitude)
     )
+    if clamped:
+        min_latitude = max(min_latitude, _MIN_LAT)
+        max_latitude = min(max_latitude, _MAX_LAT)
+        min_longitude = max(min_longitude, _MIN_LON)
+        max_longitude = min(max_longitude, _MAX_LON)
     
-    if not coords_valid:
+    if not (min_latitude <= max_latitude and min_longitude <= max_longitude):
         return {
             "error": "Coordinates outside UK bounds",
             "message": f"BGS data covers UK territory ({UK_BOUNDS['min_lat']}-{UK_BOUNDS['max_lat']}°N, {UK_BOUNDS['min_lon']}-{UK_BOUNDS['max_lon']}°E)",
-            "provided_bounds": {
-                "min_lat": min_latitude, "min_lon": min_longitude,
-                "max_lat": max_latitude, "max_lon": max_longitude
-            }
+            "provided_bounds": provided_bounds
         }
     
-    # Make API request with area bounds
-    bbox = f"{min_longitude},{min_latitude},{max_longitude},{max_latitude}"
-    data = make_api_request(bbox, limit=1000)
+    # Make API request with area bounds, tiling large areas
+    bbox = (min_longitude, min_latitude, max_longitude, max_latitude)
+    data = _fetch_tiles(tile_bbox(min_latitude, min_longitude, max_latitude, max_longitude), limit=1000)
     
     if 'error' in data:
         data['search_area'] = {
@@ -282,19 +763,25 @@ def search_boreholes_in_area(min_latitude: float, min_longitude: float,
     
     # Enhance features with calculated coordinates
     features = data.get('features', [])
-    for feature in features:
-        enhance_feature_properties(feature)
+    enhance_features(features)
     
-    return {
+    result = {
         "features": features,
         "count": len(features),
         "search_area": {
             "min_latitude": min_latitude, "min_longitude": min_longitude,
             "max_latitude": max_latitude, "max_longitude": max_longitude,
-            "bbox": bbox
+            "bbox": bbox,
+            "tiles": data["tiles"]
         },
-        "links": data.get('links', [])
+        "links": data.get('links', []),
+        "truncated": data["truncated"]
     }
+    if clamped:
+        result["clamped"] = True
+        result["provided_bounds"] = provided_bounds
+    
+    return result
 
 @mcp.tool
 def get_borehole_summary(search_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -324,50 +811,63 @@ def get_borehole_summary(search_result: Dict[str, Any]) -> Dict[str, Any]:
     # Initialize summary structure
     summary = {
         "total_boreholes": len(features),
-        "depths": [],
         "depth_statistics": {},
-        "projects": set(),
+        "projects": [],
         "locations_with_coords": 0,
         "borehole_logs_available": 0
     }
     
-    # Process each borehole feature
+    # Running depth accumulators and insertion-ordered project names
+    depth_min = math.inf
+    depth_max = -math.inf
+    depth_sum = 0.0
+    depth_count = 0
+    projects = {}
+    with_coords = 0
+    with_logs = 0
+    
+    # Process each borehole feature in a single pass
     for feature in features:
-        props = feature.get('properties', {})
+        props = feature.get('properties') or {}
+        get = props.get
         
         # Extract depth information (loca_fdep = final depth of borehole)
-        if props.get('loca_fdep') is not None:
-            try:
-                depth = float(props['loca_fdep'])
-                summary["depths"].append(depth)
-            except (ValueError, TypeError):
-                pass
+        depth = _feature_depth(props)
+        if depth is not None:
+            if depth < depth_min:
+                depth_min = depth
+            if depth > depth_max:
+                depth_max = depth
+            depth_sum += depth
+            depth_count += 1
         
         # Count features with coordinates
-        if props.get('x') and props.get('y'):
-            summary["locations_with_coords"] += 1
+        if get('x') and get('y'):
+            with_coords += 1
         
         # Collect project information
-        if props.get('proj_name'):
-            summary["projects"].add(props['proj_name'])
+        proj_name = get('proj_name')
+        if proj_name:
+            projects[proj_name] = None
         
         # Count features with detailed log data
-        if props.get('ags_log_url'):
-            summary["borehole_logs_available"] += 1
+        if get('ags_log_url'):
+            with_logs += 1
+    
+    summary["locations_with_coords"] = with_coords
+    summary["borehole_logs_available"] = with_logs
     
     # Calculate depth statistics
-    if summary["depths"]:
-        depths = summary["depths"]
+    if depth_count:
         summary["depth_statistics"] = {
-            "min_depth_m": round(min(depths), 2),
-            "max_depth_m": round(max(depths), 2),
-            "avg_depth_m": round(sum(depths) / len(depths), 2),
-            "total_drilling_m": round(sum(depths), 2),
-            "count_with_depth": len(depths)
+            "min_depth_m": round(depth_min, 2),
+            "max_depth_m": round(depth_max, 2),
+            "avg_depth_m": round(depth_sum / depth_count, 2),
+            "total_drilling_m": round(depth_sum, 2),
+            "count_with_depth": depth_count
         }
     
-    # Convert set to list for JSON serialization
-    summary["projects"] = list(summary["projects"])
+    summary["projects"] = list(projects)
     summary["search_info"] = search_result.get('search_params') or search_result.get('search_area', {})
     
     return summary
@@ -392,30 +892,18 @@ def find_deep_boreholes(latitude: float, longitude: float, buffer_km: float = 5.
         - total_searched: Total boreholes examined
         - criteria: Search criteria used
     """
-    # Get all boreholes in search area
-    search_result = get_boreholes_at_location(latitude, longitude, buffer_km)
+    # Fetch boreholes in search area, keeping and enhancing only deep ones
+    search_result = _fetch_and_enhance(latitude, longitude, buffer_km, min_depth_m=min_depth_m)
     
     if 'error' in search_result:
         return search_result
     
-    # Filter for deep boreholes
-    features = search_result.get('features', [])
-    deep_boreholes = []
-    
-    for feature in features:
-        props = feature.get('properties', {})
-        if props.get('loca_fdep'):
-            try:
-                depth = float(props['loca_fdep'])
-                if depth >= min_depth_m:
-                    deep_boreholes.append(feature)
-            except (ValueError, TypeError):
-                continue
+    deep_boreholes = search_result["features"]
     
     return {
         "deep_boreholes": deep_boreholes,
         "count": len(deep_boreholes),
-        "total_searched": len(features),
+        "total_searched": search_result["total_searched"],
         "criteria": {
             "min_depth_m": min_depth_m,
             "search_radius_km": buffer_km,
@@ -0,0 +1,405 @@
+"""Tests for the AGS Boreholes MCP server helpers."""
+
+import copy
+import math
+
+import httpx
+import numpy as np
+import pytest
+
+import server.main as main
+
+
+# Worked example from the Ordnance Survey "A guide to coordinate systems in
+# Great Britain": E 651409.903, N 313177.270 is 52°39'27.2531"N 1°43'4.5177"E
+OS_EXAMPLE_EN = (651409.903, 313177.270)
+OS_EXAMPLE_OSGB36 = (52 + 39 / 60 + 27.2531 / 3600, 1 + 43 / 60 + 4.5177 / 3600)
+
+
+def test_bng_to_osgb36_matches_os_worked_example():
+    phi, lam = main._bng_to_osgb36(*OS_EXAMPLE_EN)
+    # 1e-8 degrees is about a millimetre on the ground
+    assert math.degrees(phi) == pytest.approx(OS_EXAMPLE_OSGB36[0], abs=1e-8)
+    assert math.degrees(lam) == pytest.approx(OS_EXAMPLE_OSGB36[1], abs=1e-8)
+
+
+def test_convert_bng_to_wgs84_os_worked_example():
+    lat, lon = main.convert_bng_to_wgs84(*OS_EXAMPLE_EN)
+    assert isinstance(lat, float) and isinstance(lon, float)
+    assert lat == pytest.approx(52.6579786, abs=1e-6)
+    assert lon == pytest.approx(1.7160519, abs=1e-6)
+
+
+def test_bng_to_wgs84_arrays_match_scalars():
+    eastings = np.array([OS_EXAMPLE_EN[0], 325000.0, 530000.0])
+    northings = np.array([OS_EXAMPLE_EN[1], 673000.0, 180000.0])
+    lats, lons = main._bng_to_wgs84(eastings, northings)
+    for easting, northing, lat, lon in zip(eastings, northings, lats, lons):
+        assert main.convert_bng_to_wgs84(easting, northing) == pytest.approx((lat, lon), abs=1e-12)
+
+
+ENHANCE_CASES = {
+    "numeric": [
+        {"properties": {"x": OS_EXAMPLE_EN[0], "y": OS_EXAMPLE_EN[1], "loca_fdep": "12.5"}},
+        {"properties": {"x": 325000, "y": 673000, "loca_fdep": 3}},
+    ],
+    "numeric_strings": [
+        {"properties": {"x": "325000", "y": "673000"}},
+    ],
+    "non_numeric_fallback": [
+        {"properties": {"x": "abc", "y": 673000, "loca_id": "BAD"}},
+        {"properties": {"x": 325000, "y": 673000}},
+    ],
+    "falsy_and_none": [
+        {"properties": {"x": 0, "y": 673000}},
+        {"properties": {"x": 325000, "y": None}},
+        {"properties": {"x": 325000}},
+        {"properties": {"x": 530000, "y": 180000, "loca_fdep": None}},
+    ],
+    "null_properties": [
+        {"properties": None},
+        {},
+        {"properties": {"x": 530000, "y": 180000}},
+    ],
+}
+
+
+@pytest.mark.parametrize("case", sorted(ENHANCE_CASES))
+@pytest.mark.parametrize("search", [None, (55.9, -3.2)], ids=["no_search_point", "search_point"])
+def test_enhance_features_matches_per_feature_enhancement(case, search):
+    search_args = search or ()
+    batch = copy.deepcopy(ENHANCE_CASES[case])
+    single = copy.deepcopy(ENHANCE_CASES[case])
+    
+    main.enhance_features(batch, *search_args)
+    for feature in single:
+        main.enhance_feature_properties(feature, *search_args)
+    
+    assert batch == single
+
+
+def test_tile_bbox_small_area_is_single_tile():
+    assert main.tile_bbox(51.0, -1.0, 51.2, -0.8) == [(-1.0, 51.0, -0.8, 51.2)]
+
+
+def test_tile_bbox_covers_area_without_gaps():
+    tiles = main.tile_bbox(51.0, -1.0, 52.2, 0.1)
+    assert len(tiles) == 9
+    assert min(t[0] for t in tiles) == -1.0 and max(t[2] for t in tiles) == 0.1
+    assert min(t[1] for t in tiles) == 51.0 and max(t[3] for t in tiles) == 52.2
+    for min_lon, min_lat, max_lon, max_lat in tiles:
+        assert max_lon - min_lon <= main.TILE_SIZE_DEG
+        assert max_lat - min_lat <= main.TILE_SIZE_DEG
+    # Adjacent tiles share their edges exactly
+    assert {t[2] for t in tiles} - {0.1} <= {t[0] for t in tiles}
+
+
+def test_tile_bbox_caps_tiles_per_side():
+    tiles = main.tile_bbox(49.0, -8.0, 61.0, 2.0)
+    assert len(tiles) == main.MAX_TILES_PER_SIDE ** 2
+
+
+def _fake_api(full_width):
+    """Return a fake make_api_request that fills any tile wider than full_width."""
+    calls = []
+    
+    def fake(bbox, limit=100):
+        calls.append((bbox, limit))
+        count = limit if bbox[2] - bbox[0] > full_width else min(2, limit)
+        features = [{"properties": {"loca_id": f"{bbox}-{i}"}} for i in range(count)]
+        links = [{"rel": "next", "href": "next"}] if count == limit else [{"rel": "self", "href": "self"}]
+        return {"features": features, "links": links, "numberReturned": count}
+    
+    return fake, calls
+
+
+def test_fetch_tiles_splits_truncated_tiles(monkeypatch):
+    fake, calls = _fake_api(full_width=0.3)
+    monkeypatch.setattr(main, "make_api_request", fake)
+    result = main._fetch_tiles([(-1.0, 51.0, -0.6, 51.4)], limit=10)
+    # One full tile, split into four quadrants that are all within the limit
+    assert len(calls) == 5
+    assert result["tiles"] == 4
+    assert len(result["features"]) == 8
+    assert result["truncated"] is False
+
+
+def test_fetch_tiles_reports_truncation_when_splits_run_out(monkeypatch):
+    fake, calls = _fake_api(full_width=0.0)
+    monkeypatch.setattr(main, "make_api_request", fake)
+    result = main._fetch_tiles([(-1.0, 51.0, -0.6, 51.4)], limit=10)
+    assert len(calls) == 1 + 4 + 16
+    assert result["truncated"] is True
+    assert result["links"] == []
+
+
+def test_fetch_tiles_single_tile_keeps_links(monkeypatch):
+    fake, _ = _fake_api(full_width=1.0)
+    monkeypatch.setattr(main, "make_api_request", fake)
+    result = main._fetch_tiles([(-1.0, 51.0, -0.6, 51.4)], limit=10)
+    assert result["links"] == [{"rel": "self", "href": "self"}]
+    assert result["truncated"] is False
+
+
+def test_fetch_tiles_uk_wide_worst_case_is_bounded(monkeypatch):
+    # Every tile comes back full: the budget must bound both requests and features
+    fake, calls = _fake_api(full_width=0.0)
+    monkeypatch.setattr(main, "make_api_request", fake)
+    tiles = main.tile_bbox(49.0, -8.0, 61.0, 2.0)
+    result = main._fetch_tiles(tiles, limit=1000)
+    
+    tile_limit = main.MAX_AREA_FEATURES // len(tiles)
+    assert len(calls) == len(tiles)
+    assert all(limit == tile_limit for _, limit in calls)
+    assert len(result["features"]) <= main.MAX_AREA_FEATURES
+    assert result["truncated"] is True
+    # Every tile contributes the same share, so the subset is spatially even
+    per_tile = {}
+    for feature in result["features"]:
+        bbox = feature["properties"]["loca_id"].rsplit("-", 1)[0]
+        per_tile[bbox] = per_tile.get(bbox, 0) + 1
+    assert len(per_tile) == len(tiles)
+    assert set(per_tile.values()) == {tile_limit}
+
+
+def test_fetch_tiles_splits_only_when_budget_allows_all(monkeypatch):
+    # All four tiles fill their share; quartering them would need 16 * limit
+    # results, more than the budget, so none are split
+    fake, calls = _fake_api(full_width=0.0)
+    monkeypatch.setattr(main, "make_api_request", fake)
+    monkeypatch.setattr(main, "MAX_AREA_FEATURES", 40)
+    result = main._fetch_tiles(main.tile_bbox(51.0, -1.0, 52.0, 0.0), limit=10)
+    assert len(calls) == 4
+    assert result["truncated"] is True
+    assert len(result["features"]) == 40
+
+
+def test_merge_features_dedups_by_loca_id_in_order():
+    first = {"properties": {"loca_id": "A", "tile": 1}}
+    results = [
+        {"features": [first, {"properties": {"loca_id": "B"}}]},
+        {"features": [{"properties": {"loca_id": "A", "tile": 2}}, {"properties": {"loca_id": "C"}}]},
+    ]
+    merged = main._merge_features(results)
+    assert [f["properties"]["loca_id"] for f in merged] == ["A", "B", "C"]
+    assert merged[0] is first
+
+
+def test_merge_features_keeps_features_without_loca_id():
+    results = [
+        {"features": [{"properties": {}}, {"properties": None}]},
+        {"features": [{"properties": {"loca_id": "A"}}, {"properties": {}}]},
+    ]
+    assert len(main._merge_features(results)) == 4
+
+
+@pytest.fixture
+def empty_api(monkeypatch):
+    calls = []
+    
+    def fake(bbox, limit=100):
+        calls.append(bbox)
+        return {"features": [], "links": []}
+    
+    monkeypatch.setattr(main, "make_api_request", fake)
+    return calls
+
+
+def test_search_area_inside_uk_is_not_clamped(empty_api):
+    result = main.search_boreholes_in_area(51.0, -1.0, 51.2, -0.8)
+    assert "error" not in result
+    assert "clamped" not in result
+    assert empty_api == [(-1.0, 51.0, -0.8, 51.2)]
+
+
+def test_search_area_partly_outside_uk_is_clamped(empty_api):
+    result = main.search_boreholes_in_area(48.0, -1.0, 49.4, 0.0)
+    assert result["clamped"] is True
+    assert result["provided_bounds"]["min_lat"] == 48.0
+    assert result["search_area"]["min_latitude"] == main.UK_BOUNDS["min_lat"]
+    assert all(bbox[1] >= main.UK_BOUNDS["min_lat"] for bbox in empty_api)
+
+
+def test_search_area_entirely_outside_uk_is_rejected(empty_api):
+    result = main.search_boreholes_in_area(40.0, -1.0, 45.0, 0.0)
+    assert result["error"] == "Coordinates outside UK bounds"
+    assert empty_api == []
+
+
+@pytest.mark.parametrize("bounds", [
+    (math.nan, -1.0, 52.0, 0.0),
+    (51.0, -1.0, math.inf, 0.0),
+    (51.0, -math.inf, 52.0, 0.0),
+])
+def test_search_area_non_finite_bounds_are_rejected(empty_api, bounds):
+    result = main.search_boreholes_in_area(*bounds)
+    assert result["error"] == "Invalid coordinates"
+    assert empty_api == []
+
+
+def test_search_area_inverted_bounds_are_rejected(empty_api):
+    result = main.search_boreholes_in_area(52.0, -1.0, 51.0, 0.0)
+    assert result["error"] == "Invalid bounding box"
+    assert empty_api == []
+
+
+def _mock_client(statuses):
+    """Client answering successive requests with the given status codes."""
+    seen = []
+    
+    def handler(request):
+        status = statuses[min(len(seen), len(statuses) - 1)]
+        seen.append(request)
+        return httpx.Response(status, json={"attempt": len(seen)})
+    
+    return httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True), seen
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(main.time, "sleep", delays.append)
+    return delays
+
+
+@pytest.mark.parametrize("status", sorted(main._RETRY_STATUSES))
+def test_get_retries_gateway_errors_with_backoff(monkeypatch, sleeps, status):
+    client, seen = _mock_client([status, status, 200])
+    monkeypatch.setattr(main, "_CLIENT", client)
+    response = main._get("https://example.test/items")
+    assert response.status_code == 200
+    assert len(seen) == 3
+    assert sleeps == [main._RETRY_BACKOFF_S, main._RETRY_BACKOFF_S * 2]
+
+
+def test_get_returns_last_response_when_retries_run_out(monkeypatch, sleeps):
+    client, seen = _mock_client([503])
+    monkeypatch.setattr(main, "_CLIENT", client)
+    response = main._get("https://example.test/items")
+    assert response.status_code == 503
+    assert response.json() == {"attempt": main._MAX_RETRIES + 1}
+    assert len(seen) == main._MAX_RETRIES + 1
+    assert len(sleeps) == main._MAX_RETRIES
+
+
+@pytest.mark.parametrize("status", [200, 404, 500])
+def test_get_does_not_retry_other_statuses(monkeypatch, sleeps, status):
+    client, seen = _mock_client([status, 200])
+    monkeypatch.setattr(main, "_CLIENT", client)
+    assert main._get("https://example.test/items").status_code == status
+    assert len(seen) == 1
+    assert sleeps == []
+
+
+def test_shared_client_follows_redirects(monkeypatch):
+    def handler(request):
+        if request.url.path.endswith("/items"):
+            return httpx.Response(301, headers={"Location": "https://example.test/moved"})
+        return httpx.Response(200, json={"features": [], "links": []})
+    
+    assert main._CLIENT.follow_redirects is True
+    client = httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=main._CLIENT.follow_redirects)
+    monkeypatch.setattr(main, "_CLIENT", client)
+    assert main.make_api_request((-1.0, 51.0, -0.8, 51.2)) == {"features": [], "links": []}
+
+
+def _api_returning(features):
+    def fake(bbox, limit=100):
+        return {"features": copy.deepcopy(features), "links": []}
+    return fake
+
+
+DEPTH_FEATURES = [
+    {"properties": {"loca_id": loca_id, "x": 325000, "y": 673000, "loca_fdep": depth}}
+    for loca_id, depth in [("A", "5"), ("B", 0), ("C", "15"), ("D", None), ("E", "bad"), ("F", 20)]
+]
+
+
+def test_find_deep_boreholes_filters_before_enhancing(monkeypatch):
+    monkeypatch.setattr(main, "make_api_request", _api_returning(DEPTH_FEATURES))
+    result = main.find_deep_boreholes(55.94, -3.2, buffer_km=5.0, min_depth_m=10.0)
+    
+    assert [f["properties"]["loca_id"] for f in result["deep_boreholes"]] == ["C", "F"]
+    assert result["count"] == 2
+    # total_searched counts every feature returned, before the depth filter
+    assert result["total_searched"] == len(DEPTH_FEATURES)
+    for feature in result["deep_boreholes"]:
+        props = feature["properties"]
+        assert "calculated_latitude" in props and "distance_km" in props
+        assert props["search_buffer_km"] == 5.0
+
+
+def test_fetch_and_enhance_only_enhances_kept_features(monkeypatch):
+    returned = copy.deepcopy(DEPTH_FEATURES)
+    monkeypatch.setattr(main, "make_api_request", lambda bbox, limit=100: {"features": returned, "links": []})
+    main._fetch_and_enhance(55.94, -3.2, 5.0, min_depth_m=10.0)
+    
+    enhanced = {f["properties"]["loca_id"] for f in returned if "calculated_latitude" in f["properties"]}
+    assert enhanced == {"C", "F"}
+
+
+def test_find_deep_boreholes_zero_depth_passes_zero_minimum(monkeypatch):
+    monkeypatch.setattr(main, "make_api_request", _api_returning(DEPTH_FEATURES))
+    result = main.find_deep_boreholes(55.94, -3.2, min_depth_m=0)
+    assert [f["properties"]["loca_id"] for f in result["deep_boreholes"]] == ["A", "B", "C", "F"]
+
+
+def test_get_boreholes_at_location_enhances_all_features(monkeypatch):
+    monkeypatch.setattr(main, "make_api_request", _api_returning(DEPTH_FEATURES))
+    result = main.get_boreholes_at_location(55.94, -3.2)
+    assert result["count"] == len(DEPTH_FEATURES)
+    assert "total_searched" not in result
+    assert all("calculated_latitude" in f["properties"] for f in result["features"])
+
+
+def test_borehole_summary_single_pass_statistics():
+    search_result = {
+        "features": [
+            {"properties": {"loca_fdep": "4", "proj_name": "Zeta", "x": 1, "y": 2, "ags_log_url": "u1"}},
+            {"properties": {"loca_fdep": 10.333, "proj_name": "Alpha"}},
+            {"properties": {"loca_fdep": "bad", "proj_name": "Zeta", "ags_log_url": "u2"}},
+            {"properties": None},
+        ],
+        "search_area": {"bbox": [0, 1, 2, 3]},
+    }
+    summary = main.get_borehole_summary(search_result)
+    
+    assert "depths" not in summary
+    assert summary["total_boreholes"] == 4
+    assert summary["depth_statistics"] == {
+        "min_depth_m": 4.0,
+        "max_depth_m": 10.33,
+        "avg_depth_m": 7.17,
+        "total_drilling_m": 14.33,
+        "count_with_depth": 2,
+    }
+    # Projects are de-duplicated in first-seen order
+    assert summary["projects"] == ["Zeta", "Alpha"]
+    assert summary["locations_with_coords"] == 1
+    assert summary["borehole_logs_available"] == 2
+    assert summary["search_info"] == {"bbox": [0, 1, 2, 3]}
+
+
+def test_borehole_summary_uses_cached_depth_when_present():
+    summary = main.get_borehole_summary({"features": [
+        {"properties": {"loca_fdep": "100", "_depth_m": 7.0}},
+        {"properties": {"loca_fdep": "3"}},
+    ]})
+    assert summary["depth_statistics"]["max_depth_m"] == 7.0
+    assert summary["depth_statistics"]["min_depth_m"] == 3.0
+
+
+def test_borehole_summary_without_depths_has_empty_statistics():
+    summary = main.get_borehole_summary({"features": [{"properties": {"proj_name": "A"}}]})
+    assert summary["depth_statistics"] == {}
+    assert summary["projects"] == ["A"]
+
+
+def test_borehole_summary_of_location_search(monkeypatch):
+    monkeypatch.setattr(main, "make_api_request", _api_returning(DEPTH_FEATURES))
+    summary = main.get_borehole_summary(main.get_boreholes_at_location(55.94, -3.2))
+    # Depths 5, 0, 15 and 20 parse; None and "bad" are skipped
+    assert summary["depth_statistics"]["count_with_depth"] == 4
+    assert summary["depth_statistics"]["min_depth_m"] == 0.0
+    assert summary["depth_statistics"]["total_drilling_m"] == 40.0
+    assert summary["search_info"]["latitude"] == 55.94